@@ -7,7 +7,26 @@ __all__ = (
 )
 __version__ = (2, 2, 2)
 
+import importlib
 
-from premise.new_database import NewDatabase
-from premise.incremental import IncrementalDatabase
-from premise.utils import clear_cache, clear_inventory_cache, get_regions_definition
+# public objects are imported on first access (PEP 562),
+# so that `import premise` does not load the whole library
+_LAZY_IMPORTS = {
+    "NewDatabase": "premise.new_database",
+    "IncrementalDatabase": "premise.incremental",
+    "clear_cache": "premise.utils",
+    "clear_inventory_cache": "premise.utils",
+    "get_regions_definition": "premise.utils",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
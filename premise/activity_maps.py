@@ -3,14 +3,24 @@ activity_maps.py contains InventorySet, which is a class that provides all neces
 mapping between ``premise`` and ``ecoinvent`` terminology.
 """
 
+import os
+import pickle
+import tempfile
 from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Union
 
 import yaml
 from wurst import searching as ws
 
-from .filesystem_constants import DATA_DIR, VARIABLES_DIR
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from . import __version__
+from .filesystem_constants import DATA_DIR, DIR_CACHED_DB, VARIABLES_DIR, YAMLLoader
 
 POWERPLANT_TECHS = VARIABLES_DIR / "electricity_variables.yaml"
 FUELS_TECHS = VARIABLES_DIR / "fuels_variables.yaml"
@@ -29,6 +39,41 @@ TRUCKS = VARIABLES_DIR / "transport_roadfreight_variables.yaml"
 TRAINS = VARIABLES_DIR / "transport_railfreight_variables.yaml"
 
 
+@lru_cache(maxsize=None)
+def _load_yaml(filepath: str) -> dict:
+    """
+    Load a YAML file once and keep the parsed content in memory.
+    A pickled copy is kept in the cache folder and reused
+    as long as the YAML file has not been modified since.
+    :param filepath: YAML file path, as a string
+    :return: the parsed YAML content
+    """
+
+    filepath = Path(filepath)
+    cached_fp = (
+        DIR_CACHED_DB
+        / f"cached_{''.join(tuple(map(str, __version__)))}_{filepath.parent.name}_{filepath.stem}_yaml.pickle"
+    )
+
+    if cached_fp.exists() and cached_fp.stat().st_mtime >= filepath.stat().st_mtime:
+        with open(cached_fp, "rb") as stream:
+            return pickle.load(stream)
+
+    with open(filepath, "r", encoding="utf-8") as stream:
+        data = yaml.load(stream, Loader=YAMLLoader)
+
+    # each writer uses its own temporary file, moved in place
+    # atomically, so that concurrent processes neither overwrite
+    # each other's file nor read a partial pickle
+    with tempfile.NamedTemporaryFile(
+        dir=DIR_CACHED_DB, suffix=".tmp", delete=False
+    ) as stream:
+        pickle.dump(data, stream, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(stream.name, cached_fp)
+
+    return data
+
+
 def get_mapping(filepath: Path, var: str, model: str = None) -> dict:
     """
     Loa a YAML file and return a dictionary given a variable.
@@ -38,19 +83,29 @@ def get_mapping(filepath: Path, var: str, model: str = None) -> dict:
     :return: a dictionary
     """
 
-    with open(filepath, "r", encoding="utf-8") as stream:
-        techs = yaml.full_load(stream)
+    return _load_vars(filepath, [var], model)[var]
 
-    mapping = {}
-    for key, val in techs.items():
-        if var in val:
-            if model is None:
-                mapping[key] = val[var]
-            else:
-                if model in val.get("iam_aliases", {}):
-                    mapping[key] = val[var]
 
-    return mapping
+def _load_vars(filepath: Path, variables: List[str], model: str = None) -> dict:
+    """
+    Load a YAML file and return, in a single pass,
+    one dictionary per variable in `variables`.
+    :param filepath: YAML file path
+    :param variables: variables to return the dictionaries for.
+    :param model: if provided, only return the dictionaries for this model.
+    :return: a dictionary with variables as keys and dictionaries as values
+    """
+
+    mappings = {var: {} for var in variables}
+
+    for key, val in _load_yaml(str(filepath)).items():
+        if model is not None and model not in val.get("iam_aliases", {}):
+            continue
+        for var in variables:
+            if var in val:
+                mappings[var][key] = val[var]
+
+    return mappings
 
 
 def act_fltr(
@@ -76,36 +131,118 @@ def act_fltr(
     :rtype: list
 
     """
-    if fltr is None:
-        fltr = {}
-    if mask is None:
-        mask = {}
+    fltr, mask = _normalize_filter(fltr), _normalize_filter(mask)
+
+    assert len(fltr) > 0, "Filter dict must not be empty."
+
+    fltr, mask = _freeze_filter(fltr), _freeze_filter(mask)
+
+    # when only names are looked at, skip the
+    # wurst closures and scan the database directly
+    if all(field == "name" for field, _ in fltr + mask):
+        terms = fltr[0][1]
+        masked = mask[0][1] if mask else ()
+        return [
+            act
+            for act in database
+            if any(t in act["name"] for t in terms)
+            and not any(m in act["name"] for m in masked)
+        ]
+
+    return list(ws.get_many(database, *_compile_filter(fltr, mask)))
+
 
-    # default field is name
+def _normalize_filter(fltr: Union[str, List[str], dict, None]) -> dict:
+    """
+    Turn a filter given as a string or a list of strings
+    into a dictionary, the default field being `name`.
+    :param fltr: filter, as passed to :func:`act_fltr`
+    :return: filter dictionary
+    """
+    if fltr is None:
+        return {}
     if isinstance(fltr, (list, str)):
+        return {"name": fltr}
+    return fltr
+
+
+def _freeze_filter(fltr: dict) -> tuple:
+    """
+    Turn a filter dictionary into a hashable tuple of
+    (field, values) pairs, where values is a tuple of strings.
+    :param fltr: filter dictionary
+    :return: a tuple
+    """
+    return tuple(
+        sorted(
+            (field, tuple(value) if isinstance(value, list) else (value,))
+            for field, value in fltr.items()
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _compile_filter(fltr: tuple, mask: tuple) -> tuple:
+    """
+    Build the wurst filter functions for a frozen `fltr` and `mask`.
+    Values of a same field in `fltr` are joined (*or*),
+    while values in `mask` add up with each other (*and*).
+    :param fltr: frozen filter, see :func:`_freeze_filter`
+    :param mask: frozen mask, see :func:`_freeze_filter`
+    :return: a tuple of wurst filter functions
+    """
+    filters = [
+        ws.either(*[ws.contains(field, v) for v in values]) for field, values in fltr
+    ]
+    filters.extend(
+        ws.exclude(ws.contains(field, v)) for field, values in mask for v in values
+    )
+
+    return tuple(filters)
+
+
+def _get_filter_terms(fltr: Union[str, List[str], dict, None]) -> dict:
+    """
+    Return the strings a filter looks for, per field.
+    :param fltr: filter, as passed to :func:`act_fltr`
+    :return: a dictionary with fields as keys and sets of strings as values
+    """
+    if fltr is None:
+        return {}
+    if not isinstance(fltr, dict):
         fltr = {"name": fltr}
-    if isinstance(mask, (list, str)):
-        mask = {"name": mask}
 
-    assert len(fltr) > 0, "Filter dict must not be empty."
+    return {
+        field: {value} if isinstance(value, str) else set(value)
+        for field, value in fltr.items()
+    }
 
-    # find `act` in `database` that match `fltr`
-    # and do not match `mask`
-    filters = []
-    for field, value in fltr.items():
-        if isinstance(value, list):
-            filters.extend([ws.either(*[ws.contains(field, v) for v in value])])
-        else:
-            filters.append(ws.contains(field, value))
-
-    if mask:
-        for field, value in mask.items():
-            if isinstance(value, list):
-                filters.extend([ws.exclude(ws.contains(field, v)) for v in value])
-            else:
-                filters.append(ws.exclude(ws.contains(field, value)))
 
-    return list(ws.get_many(database, *filters))
+def _index_terms(values: List[str], terms: set) -> dict:
+    """
+    Find, in a single pass over `values`, the positions of the values
+    containing each of `terms`, using an Aho-Corasick automaton.
+    If `pyahocorasick` is not installed, an empty index is returned
+    and terms are looked up one by one instead.
+    :param values: list of field values (e.g., activity names)
+    :param terms: set of strings to look for
+    :return: a dictionary with terms as keys and sets of positions as values
+    """
+    terms = {term for term in terms if term}
+    if ahocorasick is None or not terms:
+        return {}
+
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+
+    index = {term: set() for term in terms}
+    for i, value in enumerate(values):
+        for _, term in automaton.iter(value):
+            index[term].add(i)
+
+    return index
 
 
 class InventorySet:
@@ -133,16 +270,15 @@ class InventorySet:
         self.version = version
         self.model = model
 
-        self.powerplant_filters = get_mapping(
-            filepath=POWERPLANT_TECHS, var="ecoinvent_aliases", model=self.model
+        powerplant_vars = _load_vars(
+            filepath=POWERPLANT_TECHS,
+            variables=["ecoinvent_aliases", "max_efficiency", "min_efficiency"],
+            model=self.model,
         )
 
-        self.powerplant_max_efficiency = get_mapping(
-            filepath=POWERPLANT_TECHS, var="max_efficiency", model=self.model
-        )
-        self.powerplant_min_efficiency = get_mapping(
-            filepath=POWERPLANT_TECHS, var="min_efficiency", model=self.model
-        )
+        self.powerplant_filters = powerplant_vars["ecoinvent_aliases"]
+        self.powerplant_max_efficiency = powerplant_vars["max_efficiency"]
+        self.powerplant_min_efficiency = powerplant_vars["min_efficiency"]
 
         self.powerplant_fuels_filters = get_mapping(
             filepath=POWERPLANT_TECHS, var="ecoinvent_fuel_aliases"
@@ -206,50 +342,6 @@ class InventorySet:
         """
         return self.generate_sets_from_filters(self.powerplant_filters)
 
-    def generate_daccs_map(self) -> dict:
-        """
-        Filter ecoinvent processes related to direct air capture.
-
-        :return: dictionary with el. prod. techs as keys (see below) and
-            sets of related ecoinvent activities as values.
-        :rtype: dict
-
-        """
-        return self.generate_sets_from_filters(self.daccs_filters)
-
-    def generate_carbon_storage_map(self) -> dict:
-        """
-        Filter ecoinvent processes related to carbon storage.
-
-        :return: dictionary with el. prod. techs as keys (see below) and
-            sets of related ecoinvent activities as values.
-        :rtype: dict
-
-        """
-        return self.generate_sets_from_filters(self.carbon_storage_filters)
-
-    def generate_powerplant_fuels_map(self) -> dict:
-        """
-        Filter ecoinvent processes related to electricity production.
-
-        :return: dictionary with el. prod. techs as keys (see below) and
-            sets of related ecoinvent activities as values.
-        :rtype: dict
-
-        """
-        return self.generate_sets_from_filters(self.powerplant_fuels_filters)
-
-    def generate_cement_fuels_map(self) -> dict:
-        """
-        Filter ecoinvent processes related to cement production.
-
-        :return: dictionary with el. prod. techs as keys (see below) and
-            sets of related ecoinvent activities as values.
-        :rtype: dict
-
-        """
-        return self.generate_sets_from_filters(self.cement_fuel_filters)
-
     def generate_fuel_map(self) -> dict:
         """
         Filter ecoinvent processes related to fuel supply.
@@ -339,6 +431,29 @@ class InventorySet:
 
         return mapping
 
+    def generate_sets_from_many_filters(self, *filtrs: dict, database=None) -> tuple:
+        """
+        Same as :func:`generate_sets_from_filters`, but for several
+        filter specifications at once, so that the database is
+        indexed only once for all of them.
+
+        :param filtrs: filter specifications
+        :return: a tuple with one dictionary per filter specification
+        :rtype: tuple
+        """
+
+        merged = {
+            (n, tech): entry
+            for n, filtr in enumerate(filtrs)
+            for tech, entry in filtr.items()
+        }
+        mapping = self.generate_sets_from_filters(merged, database=database)
+
+        return tuple(
+            {tech: mapping[(n, tech)] for tech in filtr}
+            for n, filtr in enumerate(filtrs)
+        )
+
     def generate_sets_from_filters(self, filtr: dict, database=None) -> dict:
         """
         Generate a dictionary with sets of activity names for
@@ -353,29 +468,55 @@ class InventorySet:
 
         database = database or self.database
 
-        names = []
-
-        for entry in filtr.values():
-            if "fltr" in entry:
-                if isinstance(entry["fltr"], dict):
-                    if "name" in entry["fltr"]:
-                        names.extend(entry["fltr"]["name"])
-                elif isinstance(entry["fltr"], list):
-                    names.extend(entry["fltr"])
-                else:
-                    names.append(entry["fltr"])
-
-        subset = list(
-            ws.get_many(
-                database,
-                ws.either(*[ws.contains("name", name) for name in names]),
-            )
-        )
+        terms = {tech: _get_filter_terms(f.get("fltr")) for tech, f in filtr.items()}
+
+        # read the filtered fields once, and record for each
+        # filter term the positions of the activities it matches.
+        # Fields that do not only hold strings are not indexed.
+        values, term_index = {}, {}
+        for field in set().union(*terms.values()):
+            field_values = [act.get(field) for act in database]
+            if all(isinstance(v, str) for v in field_values):
+                values[field] = field_values
+                term_index[field] = _index_terms(
+                    field_values,
+                    set().union(*[t.get(field, set()) for t in terms.values()]),
+                )
 
-        techs = {
-            tech: act_fltr(subset, fltr.get("fltr"), fltr.get("mask"))
-            for tech, fltr in filtr.items()
-        }
+        def find_indices(field: str, term: str) -> set:
+            if term not in term_index[field]:
+                term_index[field][term] = {
+                    i for i, value in enumerate(values[field]) if term in value
+                }
+            return term_index[field][term]
+
+        # technologies sharing the same filter and mask
+        # are only looked up once
+        results = {}
+
+        techs = {}
+        for tech, fltr in filtr.items():
+            key = tuple(
+                _freeze_filter(_normalize_filter(fltr.get(k))) for k in ("fltr", "mask")
+            )
+            if key in results:
+                techs[tech] = results[key]
+                continue
+
+            # only the activities matching the terms of every
+            # indexed field are passed on to `act_fltr`
+            candidates = [
+                set().union(*[find_indices(field, term) for term in field_terms])
+                for field, field_terms in terms[tech].items()
+                if field in values
+            ]
+            if candidates:
+                subset = [database[i] for i in sorted(set.intersection(*candidates))]
+            else:
+                subset = database
+            techs[tech] = results[key] = act_fltr(
+                subset, fltr.get("fltr"), fltr.get("mask")
+            )
 
         mapping = {
             tech: {act["name"] for act in actlst} for tech, actlst in techs.items()
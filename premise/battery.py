@@ -6,7 +6,7 @@ terms of cell energy density.
 
 import yaml
 
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 from .logger import create_logger
 from .transformation import BaseTransformation, IAMDataCollection, List, np, ws
 
@@ -18,7 +18,7 @@ def load_cell_energy_density():
     Load cell energy density data.
     """
     with open(DATA_DIR / "battery/energy_density.yaml", "r") as file:
-        data = yaml.load(file, Loader=yaml.FullLoader)
+        data = yaml.load(file, Loader=YAMLLoader)
 
     result = {}
     for key, value in data.items():
@@ -10,7 +10,7 @@ the newly created biomass markets.
 import yaml
 
 from .export import biosphere_flows_dictionary
-from .filesystem_constants import VARIABLES_DIR
+from .filesystem_constants import VARIABLES_DIR, YAMLLoader
 from .logger import create_logger
 from .transformation import (
     BaseTransformation,
@@ -111,7 +111,7 @@ class Biomass(BaseTransformation):
         # print("Create biomass markets.")
 
         with open(IAM_BIOMASS_VARS, encoding="utf-8") as stream:
-            biomass_map = yaml.safe_load(stream)
+            biomass_map = yaml.load(stream, Loader=YAMLLoader)
 
         # create region-specific "Supply of forest residue" datasets
         forest_residues_ds = self.fetch_proxies(
@@ -109,13 +109,13 @@ class Cement(BaseTransformation):
         self.version = version
 
         mapping = InventorySet(self.database)
-        self.cement_fuels_map: dict = mapping.generate_cement_fuels_map()
+        self.cement_fuels_map, self.fuel_map = mapping.generate_sets_from_many_filters(
+            mapping.cement_fuel_filters, mapping.fuels_filters
+        )
 
         # reverse the fuel map to get a mapping from ecoinvent to premise
         self.fuel_map_reverse: dict = {}
 
-        self.fuel_map: dict = mapping.generate_fuel_map()
-
         for key, value in self.fuel_map.items():
             for v in list(value):
                 self.fuel_map_reverse[v] = key
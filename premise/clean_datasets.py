@@ -17,7 +17,7 @@ from bw2data.database import DatabaseChooser
 from wurst import searching as ws
 
 from .data_collection import get_delimiter
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 
 
 def load_methane_correction_list():
@@ -25,7 +25,7 @@ def load_methane_correction_list():
     Load biomethane_correction.yaml file and return a list
     """
     with open(DATA_DIR / "fuels" / "biomethane_correction.yaml", encoding="utf-8") as f:
-        methane_correction_list = yaml.safe_load(f)
+        methane_correction_list = yaml.load(f, Loader=YAMLLoader)
     return methane_correction_list
 
 
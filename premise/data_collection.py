@@ -7,6 +7,7 @@ and emission values for different sectors, carbon capture rates, etc.
 import copy
 import csv
 import os
+from collections import defaultdict
 from functools import lru_cache
 from io import BytesIO, StringIO
 from itertools import chain
@@ -20,7 +21,13 @@ import yaml
 from cryptography.fernet import Fernet
 from prettytable import PrettyTable
 
-from .filesystem_constants import DATA_DIR, IAM_OUTPUT_DIR, VARIABLES_DIR
+from .activity_maps import _load_yaml
+from .filesystem_constants import (
+    DATA_DIR,
+    IAM_OUTPUT_DIR,
+    VARIABLES_DIR,
+    YAMLLoader,
+)
 from .geomap import Geomap
 from .marginal_mixes import consequential_method
 
@@ -76,7 +83,7 @@ def get_crops_properties() -> dict:
     :return: dict
     """
     with open(CROPS_PROPERTIES, "r", encoding="utf-8") as stream:
-        crop_props = yaml.safe_load(stream)
+        crop_props = yaml.load(stream, Loader=YAMLLoader)
 
     return crop_props
 
@@ -148,7 +155,7 @@ def get_gains_IAM_data(model, gains_scenario):
     arr = xr.concat(list_arrays, dim="pollutant")
 
     with open(GAINS_GEO_MAP, "r", encoding="utf-8") as stream:
-        geo_map = yaml.safe_load(stream)
+        geo_map = yaml.load(stream, Loader=YAMLLoader)
 
     arr.coords["region"] = [geo_map[v][model] for v in arr.region.values]
     arr = arr.drop_duplicates(dim="region")
@@ -156,6 +163,28 @@ def get_gains_IAM_data(model, gains_scenario):
     return arr
 
 
+@lru_cache
+def _index_iam_variable_labels(filepath: str) -> dict:
+    """
+    Index a variable mapping file by (variable, model), so that
+    the labels of a model are fetched without scanning the file.
+    :param filepath: YAML file path, as a string
+    :return: dictionary with (variable, model) tuples as keys and,
+    as values, dictionaries of ``premise`` terms and IAM variable names
+    """
+
+    index = defaultdict(dict)
+
+    for key, values in _load_yaml(filepath).items():
+        for variable, aliases in values.items():
+            if isinstance(aliases, dict):
+                for model, label in aliases.items():
+                    if label is not None:
+                        index[(variable, model)][key] = label
+
+    return dict(index)
+
+
 @lru_cache
 def get_gains_EU_data() -> xr.DataArray:
     """
@@ -927,18 +956,10 @@ class IAMDataCollection:
         :return: dictionary that contains fuel production names equivalence
         """
 
-        dict_vars = {}
-
-        with open(filepath, "r", encoding="utf-8") as stream:
-            out = yaml.safe_load(stream)
-
-        for key, values in out.items():
-            if variable in values:
-                if self.model in values[variable]:
-                    if values[variable][self.model] is not None:
-                        dict_vars[key] = values[variable][self.model]
-
-        return dict_vars
+        # a copy, as some callers modify the labels they receive
+        return dict(
+            _index_iam_variable_labels(str(filepath)).get((variable, self.model), {})
+        )
 
     def __get_iam_data(
         self,
@@ -1076,16 +1097,24 @@ class IAMDataCollection:
         # convert the values in these columns to numeric
         dataframe[headers] = dataframe[headers].apply(pd.to_numeric, errors="coerce")
 
+        # regions and variables are melted and grouped as categories,
+        # so that each label is stored and compared once rather than per row
         array = (
-            dataframe.melt(
-                id_vars=["region", "variables", "unit"],
+            dataframe.astype({"region": "category", "variables": "category"})
+            .melt(
+                id_vars=["region", "variables"],
+                value_vars=headers,
                 var_name="year",
                 value_name="value",
-            )[["region", "variables", "year", "unit", "value"]]
-            .groupby(["region", "variables", "year"])["value"]
+            )
+            .groupby(["region", "variables", "year"], observed=True)["value"]
             .mean()
             .to_xarray()
         )
+        array = array.assign_coords(
+            region=array.region.values.astype(object),
+            variables=array.variables.values.astype(object),
+        )
 
         # add the unit as an attribute, as a dictionary with variables as keys
         array.attrs["unit"] = dict(
@@ -1237,7 +1266,9 @@ class IAMDataCollection:
                 return None
 
         elif production_labels and energy_labels:
-            eff_data = xr.DataArray(dims=["variables"], coords={"variables": []})
+            # arrays are collected and concatenated once,
+            # rather than growing `eff_data` at each iteration
+            list_eff_data = []
             for k, v in production_labels.items():
                 # check that each element of energy.values() is in data.variables.values
                 # knowing that energy.values() is a list of lists
@@ -1279,8 +1310,13 @@ class IAMDataCollection:
                     # fill d with ones
                     d = xr.ones_like(data.loc[:, data.variables[0], :])
 
-                eff_data = xr.concat([eff_data, d], dim="variables")
+                list_eff_data.append(d)
 
+            # scalar and list labels give slices with "variables"
+            # at different positions: keep it as the first dimension
+            eff_data = xr.concat(list_eff_data, dim="variables").transpose(
+                "variables", ...
+            )
             eff_data.coords["variables"] = list(production_labels.keys())
         else:
             return None
@@ -1339,15 +1375,14 @@ class IAMDataCollection:
         # if variable is missing, we assume that the rate is 0
         # and that none of the  CO2 emissions are captured
 
+        available_vars = set(data.variables.values.tolist())
+
         if isinstance(dict_vars.get("cement - cco2", []), str):
             dict_vars["cement - cco2"] = [
                 dict_vars["cement - cco2"],
             ]
 
-        if not any(
-            x in data.variables.values.tolist()
-            for x in dict_vars.get("cement - cco2", [])
-        ):
+        if not any(x in available_vars for x in dict_vars.get("cement - cco2", [])):
             print("Cannot find variables for cement capture rate.")
             cement_rate = xr.DataArray(
                 np.zeros((len(data.region), len(data.year))),
@@ -1367,10 +1402,7 @@ class IAMDataCollection:
                 dict_vars["steel - cco2"],
             ]
 
-        if not any(
-            x in data.variables.values.tolist()
-            for x in dict_vars.get("steel - cco2", [])
-        ):
+        if not any(x in available_vars for x in dict_vars.get("steel - cco2", [])):
             print("Cannot find variables for steel capture rate.")
             steel_rate = xr.DataArray(
                 np.zeros((len(data.region), len(data.year))),
@@ -1396,10 +1428,7 @@ class IAMDataCollection:
         # IAM files
 
         if "World" in rate.region.values.tolist():
-            if not any(
-                x in data.variables.values.tolist()
-                for x in dict_vars.get("cement - cco2", [])
-            ):
+            if not any(x in available_vars for x in dict_vars.get("cement - cco2", [])):
                 rate.loc[dict(region="World", variables="cement")] = 0
             else:
                 try:
@@ -1443,10 +1472,7 @@ class IAMDataCollection:
                 except ZeroDivisionError:
                     rate.loc[dict(region="World", variables="steel")] = 0
 
-            if not any(
-                x in data.variables.values.tolist()
-                for x in dict_vars.get("steel - cco2", [])
-            ):
+            if not any(x in available_vars for x in dict_vars.get("steel - cco2", [])):
                 rate.loc[dict(region="World", variables="steel")] = 0
             else:
                 rate.loc[dict(region="World", variables="steel")] = (
@@ -1586,7 +1612,7 @@ class IAMDataCollection:
                 ) from err
 
             resource = dp.get_resource("config")
-            config_file = yaml.safe_load(resource.raw_read())
+            config_file = yaml.load(resource.raw_read(), Loader=YAMLLoader)
 
             if "production pathways" in config_file:
                 variables = {}
@@ -6,7 +6,7 @@ import copy
 
 import yaml
 
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 from .logger import create_logger
 from .transformation import (
     BaseTransformation,
@@ -27,7 +27,7 @@ def fetch_mapping(filepath: str) -> dict:
     """Returns a dictionary from a YML file"""
 
     with open(filepath, "r", encoding="utf-8") as stream:
-        mapping = yaml.safe_load(stream)
+        mapping = yaml.load(stream, Loader=YAMLLoader)
     return mapping
 
 
@@ -93,8 +93,9 @@ class DirectAirCapture(BaseTransformation):
         self.version = version
         self.system_model = system_model
         mapping = InventorySet(self.database)
-        self.dac_plants = mapping.generate_daccs_map()
-        self.carbon_storage = mapping.generate_carbon_storage_map()
+        self.dac_plants, self.carbon_storage = mapping.generate_sets_from_many_filters(
+            mapping.daccs_filters, mapping.carbon_storage_filters
+        )
 
     def generate_dac_activities(self) -> None:
         """
@@ -15,7 +15,7 @@ from functools import lru_cache
 import yaml
 
 from .export import biosphere_flows_dictionary
-from .filesystem_constants import VARIABLES_DIR
+from .filesystem_constants import VARIABLES_DIR, YAMLLoader
 from .logger import create_logger
 from .transformation import (
     BaseTransformation,
@@ -50,7 +50,7 @@ def load_electricity_variables() -> dict:
     """
 
     with open(POWERPLANT_TECHS, "r", encoding="utf-8") as stream:
-        techs = yaml.full_load(stream)
+        techs = yaml.load(stream, Loader=YAMLLoader)
 
     return techs
 
@@ -283,27 +283,6 @@ def _update_electricity(
     return scenario
 
 
-def create_fuel_map(database, version, model) -> tuple[InventorySet, dict, dict]:
-    """
-    Create a mapping between ecoinvent fuel names and IAM fuel names.
-    :param database: ecoinvent database
-    :type database: list
-    :return: mapping between ecoinvent fuel names and IAM fuel names
-    :rtype: dict
-    """
-
-    mapping = InventorySet(database=database, version=version, model=model)
-    fuel_map = mapping.generate_fuel_map()
-    # reverse the fuel map to get a mapping from ecoinvent to premise
-    fuel_map_reverse: Dict = {}
-
-    for key, value in fuel_map.items():
-        for v in list(value):
-            fuel_map_reverse[v] = key
-
-    return mapping, fuel_map, fuel_map_reverse
-
-
 class Electricity(BaseTransformation):
     """
     Class that modifies electricity markets in the database based on IAM output data.
@@ -345,18 +324,30 @@ class Electricity(BaseTransformation):
             cache,
             index,
         )
-        mapping, self.fuel_map, self.fuel_map_reverse = create_fuel_map(
-            self.database, self.version, self.model
+        # fuels, power plants and power plant fuels
+        # are mapped in a single pass over the database
+        mapping = InventorySet(
+            database=self.database, version=self.version, model=self.model
         )
-        self.powerplant_map = mapping.generate_powerplant_map()
+        (
+            self.fuel_map,
+            self.powerplant_map,
+            self.powerplant_fuels_map,
+        ) = mapping.generate_sets_from_many_filters(
+            mapping.fuels_filters,
+            mapping.powerplant_filters,
+            mapping.powerplant_fuels_filters,
+        )
+        # reverse the fuel map to get a mapping from ecoinvent to premise
+        self.fuel_map_reverse = {
+            v: key for key, value in self.fuel_map.items() for v in value
+        }
         # reverse dictionary of self.powerplant_map
         self.powerplant_map_rev = {}
         for k, v in self.powerplant_map.items():
             for pp in list(v):
                 self.powerplant_map_rev[pp] = k
 
-        self.powerplant_fuels_map = mapping.generate_powerplant_fuels_map()
-
         self.production_per_tech = self.get_production_per_tech_dict()
         losses = get_losses_per_country(self.database)
         self.network_loss = {
@@ -1492,38 +1483,16 @@ class Electricity(BaseTransformation):
                     max_power = surface  # in kW, since we assume a constant 1,000W/m^2
                     current_eff = power / max_power
 
+                    # mean, min and max efficiencies are interpolated at once
                     if self.year in module_eff.coords["year"].values:
-                        new_mean_eff = module_eff.sel(
-                            technology=pv_tech, year=self.year, efficiency_type="mean"
-                        ).values
-                        new_min_eff = module_eff.sel(
-                            technology=pv_tech, year=self.year, efficiency_type="min"
-                        ).values
-                        new_max_eff = module_eff.sel(
-                            technology=pv_tech, year=self.year, efficiency_type="max"
-                        ).values
+                        eff = module_eff.sel(technology=pv_tech, year=self.year)
                     else:
-                        new_mean_eff = (
-                            module_eff.sel(technology=pv_tech, efficiency_type="mean")
-                            .interp(
-                                year=self.year, kwargs={"fill_value": "extrapolate"}
-                            )
-                            .values
-                        )
-                        new_min_eff = (
-                            module_eff.sel(technology=pv_tech, efficiency_type="min")
-                            .interp(
-                                year=self.year, kwargs={"fill_value": "extrapolate"}
-                            )
-                            .values
-                        )
-                        new_max_eff = (
-                            module_eff.sel(technology=pv_tech, efficiency_type="max")
-                            .interp(
-                                year=self.year, kwargs={"fill_value": "extrapolate"}
-                            )
-                            .values
+                        eff = module_eff.sel(technology=pv_tech).interp(
+                            year=self.year, kwargs={"fill_value": "extrapolate"}
                         )
+                    new_mean_eff = eff.sel(efficiency_type="mean").values
+                    new_min_eff = eff.sel(efficiency_type="min").values
+                    new_max_eff = eff.sel(efficiency_type="max").values
 
                     # in case self.year <10 or >2050
                     new_mean_eff = np.clip(new_mean_eff, 0.1, 0.30)
@@ -1602,12 +1571,20 @@ class Electricity(BaseTransformation):
             "Storage, Hydrogen",
         ]
 
+        # names of the power plant datasets of these techs,
+        # gathered once for constant-time membership tests
+        plant_names = {
+            name
+            for tech, names in self.powerplant_map.items()
+            if tech in techs
+            for name in names
+        }
+
         list_datasets_to_duplicate = list(
             set(
                 dataset["name"]
                 for dataset in self.database
-                if dataset["name"]
-                in [y for k, v in self.powerplant_map.items() for y in v if k in techs]
+                if dataset["name"] in plant_names
             )
         )
 
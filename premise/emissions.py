@@ -12,7 +12,7 @@ import xarray as xr
 import yaml
 from numpy import ndarray
 
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 from .logger import create_logger
 from .transformation import (
     BaseTransformation,
@@ -34,7 +34,7 @@ def fetch_mapping(filepath: str) -> dict:
     """Returns a dictionary from a YML file"""
 
     with open(filepath, "r", encoding="utf-8") as stream:
-        mapping = yaml.safe_load(stream)
+        mapping = yaml.load(stream, Loader=YAMLLoader)
     return mapping
 
 
@@ -9,6 +9,7 @@ import multiprocessing as mp
 import os
 import re
 import uuid
+import zipfile
 from collections import defaultdict
 from datetime import datetime
 from functools import lru_cache
@@ -20,7 +21,6 @@ import numpy as np
 import pandas as pd
 import sparse
 import yaml
-from datapackage import Package
 from pandas import DataFrame
 from prettytable import PrettyTable
 from scipy import sparse as nsp
@@ -28,7 +28,7 @@ from wurst.filesystem import get_uuid
 
 from . import __version__
 from .data_collection import get_delimiter
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 from .inventory_imports import get_correspondence_bio_flows
 from .utils import reset_all_codes
 from .validation import BaseDatasetValidator
@@ -44,6 +44,11 @@ CORRESPONDENCE_BIO_FLOWS = (
 # current working directory
 DIR_DATAPACKAGE = Path.cwd() / "export" / "datapackage"
 DIR_DATAPACKAGE_TEMP = Path.cwd() / "export" / "temp"
+# number of rows of the scenario data written to disk
+# for `datapackage` to infer the schema from
+DATAPACKAGE_INFER_ROWS = 1000
+# maximum number of rows of an Excel worksheet
+EXCEL_MAX_ROWS = 1048576
 
 
 def replace_unsupported_characters(text):
@@ -63,7 +68,7 @@ def get_simapro_units() -> Dict[str, str]:
     """
 
     with open(FILEPATH_SIMAPRO_UNITS, "r", encoding="utf-8") as stream:
-        simapro_units = yaml.safe_load(stream)
+        simapro_units = yaml.load(stream, Loader=YAMLLoader)
 
     return simapro_units
 
@@ -75,7 +80,7 @@ def get_simapro_compartments() -> Dict[str, str]:
     """
 
     with open(FILEPATH_SIMAPRO_COMPARTMENTS, "r", encoding="utf-8") as stream:
-        simapro_comps = yaml.safe_load(stream)
+        simapro_comps = yaml.load(stream, Loader=YAMLLoader)
 
     return simapro_comps
 
@@ -258,17 +263,17 @@ def biosphere_flows_dictionary(version):
     if not Path(fp).is_file():
         raise FileNotFoundError("The dictionary of biosphere flows could not be found.")
 
-    csv_dict = {}
+    data = pd.read_csv(
+        fp,
+        sep=get_delimiter(filepath=fp),
+        header=None,
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8",
+        engine="c",
+    ).to_numpy()
 
-    with open(fp, encoding="utf-8") as file:
-        input_dict = csv.reader(
-            file,
-            delimiter=get_delimiter(filepath=fp),
-        )
-        for row in input_dict:
-            csv_dict[(row[0], row[1], row[2], row[3])] = row[-1]
-
-    return csv_dict
+    return dict(zip(map(tuple, data[:, :4].tolist()), data[:, -1].tolist()))
 
 
 def get_list_unique_acts(scenarios: List[dict]) -> list:
@@ -278,26 +283,23 @@ def get_list_unique_acts(scenarios: List[dict]) -> list:
     :return: list of unique activities
     """
 
-    list_unique_acts = []
+    unique_acts = set()
     for db in scenarios:
         for ds in db["database"]:
-            list_unique_acts.extend(
-                [
-                    (
-                        a["name"],
-                        a.get("product"),
-                        a.get("categories"),
-                        a.get("location"),
-                        a["unit"],
-                        a["type"],
-                    )
-                    for a in ds["exchanges"]
-                ]
+            unique_acts.update(
+                (
+                    a["name"],
+                    a.get("product"),
+                    a.get("categories"),
+                    a.get("location"),
+                    a["unit"],
+                    a["type"],
+                )
+                for a in ds["exchanges"]
             )
-    return list(set(list_unique_acts))
+    return list(unique_acts)
 
 
-bio_flows_correspondence = get_correspondence_bio_flows()
 exc_codes = {}
 
 
@@ -334,6 +336,7 @@ def correct_biosphere_flow(name, cat, unit, version):
     """
 
     bio_dict = biosphere_flows_dictionary(version)
+    bio_flows_correspondence = get_correspondence_bio_flows()
 
     try:
 
@@ -454,14 +457,40 @@ def write_formatted_data(name, data, filepath):
     return filepath
 
 
+def describe_scenario(scenario: str) -> dict:
+    """
+    Describe a scenario of a datapackage from its name.
+    :param scenario: scenario name, as "model - pathway - year",
+    followed by any external scenario
+    :return: dictionary with the scenario name and description
+    """
+
+    model, pathway, year, *external = scenario.split(" - ")
+    description = (
+        f"Prospective db, "
+        f"based on {model.upper()}, "
+        f"pathway {pathway.upper()}, "
+        f"for the year {year}"
+    )
+    if external:
+        description += f", and external scenario {' '.join(external)}"
+
+    return {"name": scenario, "description": f"{description}."}
+
+
 def build_datapackage(df, inventories, list_scenarios, ei_version, name):
     """
     Create and export a scenario datapackage.
     """
 
+    # only needed here, `datapackage` is slow to import
+    from datapackage import Package
+
     # check that directory exists, otherwise create it
     Path(DIR_DATAPACKAGE_TEMP).mkdir(parents=True, exist_ok=True)
-    df.to_csv(
+    # only a sample of the scenario data is needed on disk to infer
+    # its schema, the full table is written into the archive directly
+    df.head(DATAPACKAGE_INFER_ROWS).to_csv(
         DIR_DATAPACKAGE_TEMP / "scenario_data.csv", index=False, encoding="utf-8-sig"
     )
     write_formatted_data(
@@ -487,29 +516,8 @@ def build_datapackage(df, inventories, list_scenarios, ei_version, name):
         },
     ]
 
-    if len(list_scenarios[0]) == 3:
-        package.descriptor["scenarios"] = [
-            {
-                "name": s,
-                "description": f"Prospective db, "
-                f"based on {s.split(' - ')[0].upper()}, "
-                f"pathway {s.split(' - ')[1].upper()}, "
-                f"for the year {s.split(' - ')[-1]}.",
-            }
-            for s in list_scenarios[1:]
-        ]
-    else:
-        package.descriptor["scenarios"] = [
-            {
-                "name": s,
-                "description": f"Prospective db, "
-                f"based on {s.split(' - ')[0].upper()}, "
-                f"pathway {s.split(' - ')[1].upper()}, "
-                f"for the year {s.split(' - ')[2]}, and "
-                f"external scenario {' '.join(s.split(' - ')[3:])}.",
-            }
-            for s in list_scenarios[1:]
-        ]
+    # the first scenario is "original"
+    package.descriptor["scenarios"] = [describe_scenario(s) for s in list_scenarios[1:]]
 
     package.descriptor["keywords"] = [
         "ecoinvent",
@@ -530,11 +538,44 @@ def build_datapackage(df, inventories, list_scenarios, ei_version, name):
     Path(DIR_DATAPACKAGE).mkdir(parents=True, exist_ok=True)
 
     # save the datapackage
-    package.save(DIR_DATAPACKAGE / f"{name}.zip")
+    save_datapackage(
+        package, scenario_data=df, filepath=DIR_DATAPACKAGE / f"{name}.zip"
+    )
 
     print(f"Data package saved at {DIR_DATAPACKAGE / f'{name}.zip'}")
 
 
+def save_datapackage(package, scenario_data: DataFrame, filepath: Path) -> None:
+    """
+    Save a datapackage as a zip archive, with the same layout as
+    `Package.save`, but writing the scenario data straight from
+    the dataframe rather than copying it from a file on disk.
+    :param package: datapackage.Package
+    :param scenario_data: the full scenario data
+    :param filepath: path of the zip archive
+    """
+
+    descriptor = json.loads(json.dumps(package.descriptor))
+
+    # the fastest deflate level shrinks the CSV files several times
+    # for little more time than storing them uncompressed
+    with zipfile.ZipFile(
+        filepath, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+    ) as archive:
+        for resource, res_descriptor in zip(package.resources, descriptor["resources"]):
+            arcname = f"data/{resource.name}.{resource.descriptor['format'].lower()}"
+            if resource.name == "scenario_data":
+                with archive.open(arcname, "w", force_zip64=True) as stream:
+                    scenario_data.to_csv(
+                        stream, index=False, encoding="utf-8-sig", chunksize=100000
+                    )
+            else:
+                archive.write(resource.source, arcname)
+            res_descriptor["path"] = arcname
+
+        archive.writestr("datapackage.json", json.dumps(descriptor, indent=4))
+
+
 def generate_scenario_factor_file(
     origin_db: list,
     scenarios: list,
@@ -628,6 +669,7 @@ def generate_scenario_difference_file(
     """
 
     bio_dict = biosphere_flows_dictionary(version)
+    bio_flows_correspondence = get_correspondence_bio_flows()
 
     exc_codes.update(
         {
@@ -713,6 +755,15 @@ def generate_scenario_difference_file(
 
     inds_std = sparse.argwhere((m[..., 1:] == m[..., 0, None]).all(axis=-1).T == False)
 
+    # fetch the values of these exchanges across scenarios
+    # at once, rather than indexing the sparse array row by row
+    scenario_values = np.column_stack(
+        [
+            np.asarray(matrix.tocsr()[inds_std[:, 1], inds_std[:, 0]]).ravel()
+            for matrix in matrices.values()
+        ]
+    )
+
     for i in inds_std:
         c_name, c_ref, c_cat, c_loc, c_unit, _ = acts_ind[i[0]]
         s_name, s_ref, s_cat, s_loc, s_unit, s_type = acts_ind[i[1]]
@@ -721,7 +772,9 @@ def generate_scenario_difference_file(
         exc_key_supplier = None
 
         if s_type == "biosphere":
-            database_name = "biosphere3"
+            # keys point to the biosphere database
+            # the scenario difference file is meant for
+            database_name = biosphere_name
 
             key_exc = (
                 s_name,
@@ -764,8 +817,6 @@ def generate_scenario_difference_file(
             s_type,
         ]
 
-        row.extend(m[i[1], i[0], :])
-
         dataframe_rows.append(row)
 
     columns = [
@@ -784,9 +835,18 @@ def generate_scenario_difference_file(
         "to database",
         "to key",
         "flow type",
-    ] + list_scenarios
+    ]
 
-    df = pd.DataFrame(dataframe_rows, columns=columns)
+    # exchange descriptions and scenario values are kept apart,
+    # so that the values go into the dataframe as one numeric block
+    # rather than being inferred row by row
+    df = pd.concat(
+        [
+            pd.DataFrame(dataframe_rows, columns=columns),
+            pd.DataFrame(scenario_values, columns=list_scenarios),
+        ],
+        axis=1,
+    )
 
     df["to categories"] = None
     df = df.replace({"None": None, np.nan: None})
@@ -797,14 +857,6 @@ def generate_scenario_difference_file(
         None
     )
 
-    df.loc[df["flow type"] == "biosphere", "from database"] = biosphere_name
-
-    # update the tuples in `from key` to make sure the first element
-    # is the biosphere database name
-    df.loc[df["flow type"] == "biosphere", "from key"] = df.loc[
-        df["flow type"] == "biosphere", "from key"
-    ].map(lambda x: (biosphere_name, x[1]))
-
     new_db, df = find_technosphere_keys(new_db, df)
 
     # return the dataframe and the new db
@@ -865,7 +917,7 @@ def generate_superstructure_db(
     :param db_name: the name of the new database
     :param filepath: the filepath of the new database
     :param version: the version of the new database
-    :param file_format: the format of the scenario difference file. Can be "excel", "csv" or "feather".
+    :param file_format: the format of the scenario difference file. Can be "excel", "csv", "feather" or "parquet".
     :param preserve_original_column: whether to keep the original column in the scenario difference file
     :param scenario_list: a list of external scenarios
 
@@ -884,34 +936,28 @@ def generate_superstructure_db(
         scenario_list=scenario_list,
     )
 
-    # remove unneeded columns "to unit"
-    df = df.drop(columns=["to unit"])
-
-    # rename column "from unit" to "unit"
-    df = df.rename(columns={"from unit": "unit"})
-
-    # remove the column `original`
+    # remove unneeded unit columns, and the column `original`,
+    # in one go, as each `drop` copies the whole dataframe
+    columns_to_drop = ["to unit", "from unit"]
     if not preserve_original_column:
-        df = df.drop(columns=["original"])
+        columns_to_drop.append("original")
     else:
         scenario_list = ["original"] + scenario_list
 
-    if "unit" in df.columns:
-        df = df.drop(columns=["unit"])
+    df = df.drop(columns=columns_to_drop)
 
     if filepath is not None:
         filepath = Path(filepath)
     else:
         filepath = Path.cwd() / "export" / "scenario diff files"
 
-    if not os.path.exists(filepath):
-        os.makedirs(filepath)
+    os.makedirs(filepath, exist_ok=True)
 
     # Drop duplicate rows
-    # should not be any, but just in case
+    # should not be any, but just in case.
+    # Detecting duplicates on `from key` and `to key` also
+    # catches fully identical rows, so one pass is enough.
     before = len(df)
-    df = df.drop_duplicates()
-    # detect duplicate based on `from key` and `to key`
     df = df.drop_duplicates(subset=["from key", "to key"])
     after = len(df)
     print(f"Dropped {before - after} duplicate(s).")
@@ -921,7 +967,7 @@ def generate_superstructure_db(
 
     # if df is longer than the row limit of Excel,
     # the export to Excel is not an option
-    if len(df) > 1048576:
+    if file_format == "excel" and len(df) > EXCEL_MAX_ROWS:
         file_format = "csv"
         print(
             "The scenario difference file is too long to be exported to Excel. Exporting to CSV instead."
@@ -936,6 +982,9 @@ def generate_superstructure_db(
     elif file_format == "feather":
         filepath_sdf = filepath / f"scenario_diff_{db_name}.feather"
         df.to_feather(filepath_sdf)
+    elif file_format == "parquet":
+        filepath_sdf = filepath / f"scenario_diff_{db_name}.parquet"
+        df.to_parquet(filepath_sdf, index=False)
     else:
         raise ValueError(f"Unknown format {file_format}")
 
@@ -1214,8 +1263,7 @@ class Export:
         :param export_uncertainty: if True, export uncertainty data
         """
 
-        if not os.path.exists(self.filepath):
-            os.makedirs(self.filepath)
+        os.makedirs(self.filepath, exist_ok=True)
 
         # Export A matrix
         rows = self.create_A_matrix_coordinates()
@@ -1388,8 +1436,7 @@ class Export:
         return dict_categories
 
     def export_db_to_simapro(self, olca_compartments=False):
-        if not os.path.exists(self.filepath):
-            os.makedirs(self.filepath)
+        os.makedirs(self.filepath, exist_ok=True)
 
         dict_bio = get_simapro_biosphere_dictionnary()
 
@@ -21,7 +21,7 @@ from .activity_maps import InventorySet
 from .clean_datasets import get_biosphere_flow_uuid
 from .data_collection import IAMDataCollection
 from .external_data_validation import check_inventories, find_iam_efficiency_change
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 from .inventory_imports import (
     AdditionalInventory,
     generate_migration_maps,
@@ -45,7 +45,7 @@ if not Path(DIR_LOGS).exists():
     Path(DIR_LOGS).mkdir(parents=True, exist_ok=True)
 
 with open(LOG_CONFIG, encoding="utf-8") as f:
-    config = yaml.safe_load(f.read())
+    config = yaml.load(f.read(), Loader=YAMLLoader)
     logging.config.dictConfig(config)
 
 logger = logging.getLogger("external")
@@ -82,7 +82,7 @@ def _update_external_scenarios(
                     inventories.extend(additional.merge_inventory())
 
             resource = data_package.get_resource("config")
-            config_file = yaml.safe_load(resource.raw_read())
+            config_file = yaml.load(resource.raw_read(), Loader=YAMLLoader)
 
             checked_inventories, checked_database, configuration = check_inventories(
                 configuration=config_file,
@@ -351,26 +351,24 @@ def fetch_dataset_description_from_production_pathways(
     :param item: production pathway
     :return: dictionary with variables
     """
-    for p, v in configuration["production pathways"].items():
-        if p == item:
-            if "exists in original database" not in v["ecoinvent alias"]:
-                v["ecoinvent alias"].update({"exists in original database": True})
-
-            if "new dataset" not in v["ecoinvent alias"]:
-                v["ecoinvent alias"].update({"new dataset": False})
-
-            if "regionalize" not in v["ecoinvent alias"]:
-                v["ecoinvent alias"].update({"regionalize": False})
-
-            return (
-                v["ecoinvent alias"]["name"],
-                v["ecoinvent alias"]["reference product"],
-                v["ecoinvent alias"]["exists in original database"],
-                v["ecoinvent alias"]["new dataset"],
-                v["ecoinvent alias"]["regionalize"],
-                v["ecoinvent alias"].get("ratio", 1),
-            )
-    return
+    pathway = configuration["production pathways"].get(item)
+
+    if pathway is None:
+        return
+
+    alias = pathway["ecoinvent alias"]
+    alias.setdefault("exists in original database", True)
+    alias.setdefault("new dataset", False)
+    alias.setdefault("regionalize", False)
+
+    return (
+        alias["name"],
+        alias["reference product"],
+        alias["exists in original database"],
+        alias["new dataset"],
+        alias["regionalize"],
+        alias.get("ratio", 1),
+    )
 
 
 def fetch_var(config_file: dict, list_vars: list) -> list:
@@ -453,7 +451,7 @@ class ExternalScenario(BaseTransformation):
 
         """
 
-        processed = []
+        processed = set()
 
         for ds in ws.get_many(
             self.database,
@@ -465,7 +463,7 @@ class ExternalScenario(BaseTransformation):
                 del ds["regionalize"]
 
             if ds["location"] not in regions and ds["name"] not in processed:
-                processed.append(ds["name"])
+                processed.add(ds["name"])
 
                 # Check if datasets already exist for IAM regions
                 # if not, create them
@@ -481,31 +479,21 @@ class ExternalScenario(BaseTransformation):
 
                 # add production volume
                 if ds.get("production volume variable"):
+                    # fetch the volumes of all regions at once,
+                    # rather than interpolating region by region
+                    production_volume = data["production volume"].sel(
+                        variables=ds["production volume variable"]
+                    )
+                    if self.year in production_volume.coords["year"].values:
+                        production_volume = production_volume.sel(year=self.year)
+                    else:
+                        production_volume = production_volume.interp(year=self.year)
+
                     for region, act in new_acts.items():
-                        if region in data["production volume"].region.values:
-                            if (
-                                self.year
-                                in data["production volume"].coords["year"].values
-                            ):
-                                act["production volume"] = (
-                                    data["production volume"]
-                                    .sel(
-                                        region=region,
-                                        variables=ds["production volume variable"],
-                                        year=self.year,
-                                    )
-                                    .values
-                                )
-                            else:
-                                act["production volume"] = (
-                                    data["production volume"]
-                                    .sel(
-                                        region=region,
-                                        variables=ds["production volume variable"],
-                                    )
-                                    .interp(year=self.year)
-                                    .values
-                                )
+                        if region in production_volume.region.values:
+                            act["production volume"] = production_volume.sel(
+                                region=region
+                            ).values
 
                 # add new datasets to database
                 self.database.extend(new_acts.values())
@@ -721,7 +709,7 @@ class ExternalScenario(BaseTransformation):
         for i, dp in enumerate(self.datapackages):
             # Open corresponding config file
             resource = dp.get_resource("config")
-            config_file = yaml.safe_load(resource.raw_read())
+            config_file = yaml.load(resource.raw_read(), Loader=YAMLLoader)
 
             # Check if information on market creation is provided
             if "markets" in config_file:
@@ -1401,11 +1389,9 @@ class ExternalScenario(BaseTransformation):
             if not (d["name"] == new_name and d["reference product"] == new_ref)
         ]
 
+        replaced = {(x["name"], x["product"]) for x in replaces}
         datasets = [
-            d
-            for d in datasets
-            if (d["name"], d["reference product"])
-            not in [(x["name"], x["product"]) for x in replaces]
+            d for d in datasets if (d["name"], d["reference product"]) not in replaced
         ]
 
         list_fltr = []
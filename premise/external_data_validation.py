@@ -16,6 +16,7 @@ from datapackage import Package, exceptions, validate
 from prettytable import PrettyTable
 from schema import And, Optional, Schema, Use
 
+from .filesystem_constants import YAMLLoader
 from .geomap import Geomap
 from .utils import load_constants
 
@@ -267,12 +268,9 @@ def check_inventories(
         print(table)
 
         for k, v in d.items():
-            configuration["production pathways"][k]["ecoinvent alias"][
-                "duplicate"
-            ] = True
-            configuration["production pathways"][k]["ecoinvent alias"][
-                "name"
-            ] += f"_{k}"
+            alias = configuration["production pathways"][k]["ecoinvent alias"]
+            alias["duplicate"] = True
+            alias["name"] += f"_{k}"
 
     geo = Geomap(model=model)
 
@@ -328,10 +326,11 @@ def check_inventories(
         )
 
     list_datasets = [(i["name"], i["reference product"]) for i in inventory_data]
+    lower_datasets = {(x[0].lower(), x[1].lower()) for x in list_datasets}
 
     try:
         assert all(
-            (i[0], i[1]) in [(x[0].lower(), x[1].lower()) for x in list_datasets]
+            (i[0], i[1]) in lower_datasets
             for i, v in d_datasets.items()
             if not v["exists in original database"]
             and not v.get("new dataset")
@@ -343,8 +342,7 @@ def check_inventories(
             for i, v in d_datasets.items()
             if not v["exists in original database"]
             and not v.get("new dataset")
-            and (i[0].lower(), i[1].lower())
-            in [(x[0].lower(), x[1].lower()) for x in list_datasets]
+            and (i[0].lower(), i[1].lower()) in lower_datasets
         ]
 
         raise AssertionError(
@@ -642,7 +640,7 @@ def list_all_iam_regions(configuration):
 def check_config_file(datapackage: datapackage.Package) -> int:
 
     resource = datapackage.get_resource("config")
-    config_file = yaml.safe_load(resource.raw_read())
+    config_file = yaml.load(resource.raw_read(), Loader=YAMLLoader)
 
     file_schema = Schema(
         {
@@ -804,7 +802,7 @@ def check_config_file(datapackage: datapackage.Package) -> int:
     needs_imported_inventories = False
 
     resource = datapackage.get_resource("config")
-    config_file = yaml.safe_load(resource.raw_read())
+    config_file = yaml.load(resource.raw_read(), Loader=YAMLLoader)
 
     if len(list(config_file["production pathways"].keys())) != sum(
         get_recursively(
@@ -828,7 +826,7 @@ def check_scenario_data_file(
     df = pd.DataFrame(scenario_data, columns=scenario_headers)
 
     resource = datapackage.get_resource("config")
-    config_file = yaml.safe_load(resource.raw_read())
+    config_file = yaml.load(resource.raw_read(), Loader=YAMLLoader)
 
     mandatory_fields = [
         "scenario",
@@ -971,18 +969,18 @@ def check_external_scenarios(external_scenarios: list) -> list:
 def fetch_dataset_description_from_production_pathways(
     configuration: dict, item: str
 ) -> tuple:
-    for p, v in configuration["production pathways"].items():
-        if p == item:
-            if "exists in original database" not in v["ecoinvent alias"]:
-                v["ecoinvent alias"].update({"exists in original database": True})
-
-            if "new dataset" not in v["ecoinvent alias"]:
-                v["ecoinvent alias"].update({"new dataset": False})
-
-            return (
-                v["ecoinvent alias"]["name"],
-                v["ecoinvent alias"]["reference product"],
-                v["ecoinvent alias"]["exists in original database"],
-                v["ecoinvent alias"]["new dataset"],
-            )
-    return None, None, None, None
+    pathway = configuration["production pathways"].get(item)
+
+    if pathway is None:
+        return None, None, None, None
+
+    alias = pathway["ecoinvent alias"]
+    alias.setdefault("exists in original database", True)
+    alias.setdefault("new dataset", False)
+
+    return (
+        alias["name"],
+        alias["reference product"],
+        alias["exists in original database"],
+        alias["new dataset"],
+    )
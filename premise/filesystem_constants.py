@@ -7,13 +7,19 @@ from pathlib import Path
 import platformdirs
 import yaml
 
+# use the libyaml-backed loader when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 
 def load_var_file():
     """Check if the variable file exists and load it."""
     var_file = Path.cwd() / "variables.yaml"
     if var_file.exists():
         with open(var_file, "r") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YAMLLoader)
     else:
         return None
 
@@ -21,9 +27,10 @@ def load_var_file():
 VARIABLES = load_var_file() or {}
 
 # Directories for data which comes with Premise
-DATA_DIR = Path(__file__).resolve().parent / "data"
+PACKAGE_DIR = Path(__file__).resolve().parent
+DATA_DIR = PACKAGE_DIR / "data"
 INVENTORY_DIR = DATA_DIR / "additional_inventories"
-VARIABLES_DIR = Path(__file__).resolve().parent / "iam_variables_mapping"
+VARIABLES_DIR = PACKAGE_DIR / "iam_variables_mapping"
 IAM_OUTPUT_DIR = DATA_DIR / "iam_output_files"
 
 if "USER_DATA_BASE_DIR" in VARIABLES:
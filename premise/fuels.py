@@ -8,7 +8,7 @@ from functools import lru_cache
 import xarray as xr
 import yaml
 
-from .filesystem_constants import DATA_DIR, VARIABLES_DIR
+from .filesystem_constants import DATA_DIR, VARIABLES_DIR, YAMLLoader
 from .inventory_imports import get_biosphere_code
 from .logger import create_logger
 from .transformation import (
@@ -47,7 +47,7 @@ def fetch_mapping(filepath: str) -> dict:
     """Returns a dictionary from a YML file"""
 
     with open(filepath, encoding="utf-8") as stream:
-        mapping = yaml.safe_load(stream)
+        mapping = yaml.load(stream, Loader=YAMLLoader)
     return mapping
 
 
@@ -382,33 +382,34 @@ class Fuels(BaseTransformation):
             for sub_type in sub_types
         }
 
+        available_variables = set(
+            self.iam_data.production_volumes.coords["variables"].values.tolist()
+        )
         self.iam_fuel_markets = self.iam_data.production_volumes.sel(
             variables=[
                 g
-                for g in [
-                    item
-                    for sublist in list(self.fuel_groups.values())
-                    for item in sublist
-                ]
-                if g
-                in self.iam_data.production_volumes.coords["variables"].values.tolist()
+                for sub_types in self.fuel_groups.values()
+                for g in sub_types
+                if g in available_variables
             ]
         )
 
-        self.fuel_efficiencies = xr.DataArray(
-            dims=["variables"], coords={"variables": []}
-        )
-        for efficiency in [
-            self.iam_data.petrol_efficiencies,
-            self.iam_data.diesel_efficiencies,
-            self.iam_data.gas_efficiencies,
-            self.iam_data.hydrogen_efficiencies,
-        ]:
-            if efficiency is not None:
-                self.fuel_efficiencies = xr.concat(
-                    [self.fuel_efficiencies, efficiency],
-                    dim="variables",
-                )
+        fuel_efficiencies = [
+            efficiency
+            for efficiency in [
+                self.iam_data.petrol_efficiencies,
+                self.iam_data.diesel_efficiencies,
+                self.iam_data.gas_efficiencies,
+                self.iam_data.hydrogen_efficiencies,
+            ]
+            if efficiency is not None
+        ]
+        if fuel_efficiencies:
+            self.fuel_efficiencies = xr.concat(fuel_efficiencies, dim="variables")
+        else:
+            self.fuel_efficiencies = xr.DataArray(
+                dims=["variables"], coords={"variables": []}
+            )
 
         # create fuel filters
         mapping = InventorySet(self.database)
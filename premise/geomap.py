@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional
 import yaml
 from constructive_geometries import Geomatcher
 
-from .filesystem_constants import VARIABLES_DIR
+from .filesystem_constants import VARIABLES_DIR, YAMLLoader
 
 ECO_IAM_MAPPING_FILE = VARIABLES_DIR / "missing_geography_equivalences.yaml"
 TOPOLOGIES_DIR = VARIABLES_DIR / "topologies"
@@ -41,7 +41,7 @@ class Geomap:
         Load constants from the constants.yaml file.
         """
         with open(CONSTANTS_FILE, "r", encoding="utf-8") as stream:
-            return yaml.safe_load(stream)
+            return yaml.load(stream, Loader=YAMLLoader)
 
     @staticmethod
     def load_json(filepath: Path) -> Dict:
@@ -70,7 +70,7 @@ class Geomap:
         Return a dictionary with additional ecoinvent to IAM mappings.
         """
         with open(ECO_IAM_MAPPING_FILE, "r", encoding="utf-8") as stream:
-            return yaml.safe_load(stream)
+            return yaml.load(stream, Loader=YAMLLoader)
 
     def setup_geography(self) -> None:
         """
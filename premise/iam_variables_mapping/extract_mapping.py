@@ -3,6 +3,11 @@ import glob
 import pandas as pd
 import yaml
 
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
+
 # Initialize a dictionary to store DataFrames
 dfs = {}
 
@@ -10,7 +15,7 @@ dfs = {}
 # Function to process each YAML file and extract data into DataFrame
 def process_yaml(file_path):
     with open(file_path, "r") as file:
-        data = yaml.safe_load(file)
+        data = yaml.load(file, Loader=YAMLLoader)
     df_data = []
 
     def append_data(key, model, variable, variable_type):
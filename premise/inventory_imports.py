@@ -21,7 +21,12 @@ from wurst import searching as ws
 
 from .clean_datasets import remove_categories, remove_uncertainty
 from .data_collection import get_delimiter
-from .filesystem_constants import DATA_DIR, DIR_CACHED_DB, INVENTORY_DIR
+from .filesystem_constants import (
+    DATA_DIR,
+    DIR_CACHED_DB,
+    INVENTORY_DIR,
+    YAMLLoader,
+)
 from .geomap import Geomap
 
 FILEPATH_MIGRATION_MAP = INVENTORY_DIR / "migration_map.csv"
@@ -42,13 +47,14 @@ logging.basicConfig(
 )
 
 
+@lru_cache
 def get_correspondence_bio_flows():
     """
     Mapping between ei39 and ei<39 biosphere flows.
     """
 
     with open(CORRESPONDENCE_BIO_FLOWS, "r", encoding="utf-8") as stream:
-        flows = yaml.safe_load(stream)
+        flows = yaml.load(stream, Loader=YAMLLoader)
         return flows
 
 
@@ -81,7 +87,7 @@ def get_biosphere_code(version) -> dict:
 
 def get_consequential_blacklist():
     with open(FILEPATH_CONSEQUENTIAL_BLACKLIST, "r", encoding="utf-8") as stream:
-        flows = yaml.safe_load(stream)
+        flows = yaml.load(stream, Loader=YAMLLoader)
         return flows
 
 
@@ -22,11 +22,12 @@ is_config_loaded = False  # Flag to track if the logging config has been loaded
 
 
 import logging.config
+import os
 from pathlib import Path
 
 import yaml
 
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 
 LOG_CONFIG = DATA_DIR / "utils" / "logging" / "logconfig.yaml"
 DIR_LOG_REPORT = Path.cwd() / "export" / "logs"
@@ -40,7 +41,7 @@ if not Path(DIR_LOG_REPORT).exists():
 def create_logger(handler):
     """Create a logger with the given handler."""
     with open(LOG_CONFIG, encoding="utf-8") as f:
-        config = yaml.safe_load(f.read())
+        config = yaml.load(f.read(), Loader=YAMLLoader)
         logging.config.dictConfig(config)
 
     logger = logging.getLogger(handler)
@@ -52,15 +53,16 @@ def empty_log_files():
     """
     Delete all log files found in DIR_LOG_REPORT.
     """
-    for file in DIR_LOG_REPORT.iterdir():
-        # if suffix is ".log"
-        if file.suffix == ".log":
-            try:
-                file.unlink()
-            except PermissionError:
+    with os.scandir(DIR_LOG_REPORT) as entries:
+        for entry in entries:
+            # if suffix is ".log"
+            if entry.name.endswith(".log") and entry.is_file():
                 try:
-                    # instead, let's empty the file
-                    with open(file, "w") as f:
-                        f.write("")
+                    os.unlink(entry.path)
                 except PermissionError:
-                    pass
+                    try:
+                        # instead, let's empty the file
+                        with open(entry.path, "w") as f:
+                            f.write("")
+                    except PermissionError:
+                        pass
@@ -14,7 +14,7 @@ import yaml
 from numpy import ndarray
 from prettytable import ALL, PrettyTable
 
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 
 IAM_LEADTIMES = DATA_DIR / "consequential" / "leadtimes.yaml"
 IAM_LIFETIMES = DATA_DIR / "consequential" / "lifetimes.yaml"
@@ -30,7 +30,7 @@ def get_lifetime(list_tech: Tuple) -> np.ndarray:
     :rtype: DataArray
     """
     with open(IAM_LIFETIMES, "r", encoding="utf-8") as stream:
-        dict_ = yaml.safe_load(stream)
+        dict_ = yaml.load(stream, Loader=YAMLLoader)
 
     dict_ = {k: v for k, v in dict_.items() if k in list_tech}
 
@@ -54,7 +54,7 @@ def get_leadtime(list_tech: Tuple) -> np.ndarray:
     :rtype: np.array
     """
     with open(IAM_LEADTIMES, "r", encoding="utf-8") as stream:
-        dict_ = yaml.safe_load(stream)
+        dict_ = yaml.load(stream, Loader=YAMLLoader)
 
     dict_ = {k: dict_[k] for k in list(list_tech)}
 
@@ -7,6 +7,7 @@ as well as export it back.
 import logging
 import os
 import pickle
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import List, Union
@@ -469,6 +470,38 @@ def _export_to_olca(obj):
     obj.export_db_to_simapro(olca_compartments=True)
 
 
+def _update_scenario(
+    scenario: dict, sectors: list, sector_update_methods: dict
+) -> dict:
+    """
+    Apply the update functions of `sectors` to a scenario,
+    and dump its database back to disk.
+    :param scenario: scenario dictionary, with its database dumped to disk
+    :param sectors: list of sectors to update
+    :param sector_update_methods: update function and arguments, per sector
+    :return: the updated scenario dictionary
+    """
+
+    scenario = load_database(scenario)
+
+    for sector in sectors:
+        if sector in scenario.get("applied functions", []):
+            print(f"Function to update {sector} already applied to scenario.")
+            continue
+
+        # Prepare the function and arguments
+        update_func = sector_update_methods[sector]["func"]
+        fixed_args = sector_update_methods[sector]["args"]
+        scenario = update_func(scenario, *fixed_args)
+
+        if "applied functions" not in scenario:
+            scenario["applied functions"] = []
+        scenario["applied functions"].append(sector)
+
+    # dump database
+    return dump_database(scenario)
+
+
 def check_presence_biosphere_database(biosphere_name: str) -> str:
     """
     Check that the biosphere database is present in the current project.
@@ -650,7 +683,8 @@ class NewDatabase:
         print("Cannot find cached database. Will create one now for next time...")
         clear_existing_cache()
         database = self.__clean_database()
-        pickle.dump(database, open(file_name, "wb"))
+        with open(file_name, "wb") as f:
+            pickle.dump(database, f, protocol=pickle.HIGHEST_PROTOCOL)
         return database
 
     def __find_cached_inventories(self, db_name: str) -> Union[None, List[dict]]:
@@ -684,7 +718,8 @@ class NewDatabase:
         # else, extract the database, pickle it for next time and return it
         print("Cannot find cached inventories. Will create them now for next time...")
         data = self.__import_inventories()
-        pickle.dump(data, open(file_name, "wb"))
+        with open(file_name, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
         print(
             "Data cached. It is advised to restart your workflow at this point.\n"
             "This allows premise to use the cached data instead, which results in\n"
@@ -867,9 +902,12 @@ class NewDatabase:
 
         return data
 
-    def update(self, sectors: [str, list, None] = None) -> None:
+    def update(self, sectors: [str, list, None] = None, parallel: bool = False) -> None:
         """
         Update a specific sector by name.
+        :param sectors: sector(s) to update. If None, all sectors are updated.
+        :param parallel: if True, scenarios are updated in parallel,
+        in separate processes. Each process holds a database in memory.
         """
         sector_update_methods = {
             "biomass": {
@@ -946,35 +984,46 @@ class NewDatabase:
             [item for item in sectors if item not in sector_update_methods]
         )
 
+        # scenarios without a database of their own start from
+        # the source database, and all databases are dumped to disk,
+        # so that only file paths are sent to worker processes
+        for scenario in self.scenarios:
+            if scenario.get("database") is None and not os.path.isfile(
+                scenario.get("database filepath", "")
+            ):
+                scenario["database"] = self.database
+            dump_database(scenario)
+
+        # databases are on disk by now, and scenarios are pickled
+        # by the executor anyway: only check the update functions
+        if parallel and len(self.scenarios) > 1:
+            try:
+                pickle.dumps(sector_update_methods)
+            except (pickle.PicklingError, TypeError, AttributeError) as err:
+                print(f"Update functions cannot be sent to other processes ({err}).")
+                print("Scenarios will be updated one after the other.")
+                parallel = False
+
         with tqdm(total=len(self.scenarios), desc=description, ncols=70) as pbar_outer:
-            for scenario in self.scenarios:
-                # add database to scenarios
-                try:
-                    scenario = load_database(scenario)
-                except KeyError:
-                    scenario["database"] = pickle.loads(pickle.dumps(self.database, -1))
-                except FileNotFoundError:
-                    scenario["database"] = pickle.loads(pickle.dumps(self.database, -1))
-                for sector in sectors:
-                    if sector in scenario.get("applied functions", []):
-                        print(
-                            f"Function to update {sector} already applied to scenario."
-                        )
-                        continue
-
-                    # Prepare the function and arguments
-                    update_func = sector_update_methods[sector]["func"]
-                    fixed_args = sector_update_methods[sector]["args"]
-                    scenario = update_func(scenario, *fixed_args)
-
-                    if "applied functions" not in scenario:
-                        scenario["applied functions"] = []
-                    scenario["applied functions"].append(sector)
-
-                # dump database
-                dump_database(scenario)
-                # Manually update the outer progress bar after each sector is completed
-                pbar_outer.update()
+            if parallel and len(self.scenarios) > 1:
+                with ProcessPoolExecutor(
+                    max_workers=min(len(self.scenarios), os.cpu_count() or 1)
+                ) as executor:
+                    results = executor.map(
+                        _update_scenario,
+                        self.scenarios,
+                        [sectors] * len(self.scenarios),
+                        [sector_update_methods] * len(self.scenarios),
+                    )
+                    for scenario, result in zip(self.scenarios, results):
+                        scenario.clear()
+                        scenario.update(result)
+                        pbar_outer.update()
+            else:
+                for scenario in self.scenarios:
+                    _update_scenario(scenario, sectors, sector_update_methods)
+                    # Manually update the outer progress bar after each sector is completed
+                    pbar_outer.update()
         print("Done!\n")
 
     def write_superstructure_db_to_brightway(
@@ -989,7 +1038,7 @@ class NewDatabase:
         according to https://github.com/dgdekoning/brightway-superstructure
         :param name: name of the super-structure database
         :param filepath: filepath of the "scenarios difference file"
-        :param file_format: format of the "scenarios difference file" export. Can be "excel", "csv" or "feather".
+        :param file_format: format of the "scenarios difference file" export. Can be "excel", "csv", "feather" or "parquet".
         :param preserve_original_column: if True, the original column names are preserved in the super-structure database.
         :return: filepath of the "scenarios difference file"
         """
@@ -1158,8 +1207,9 @@ class NewDatabase:
                     f"strings for `filepath`, not {type(filepath)}."
                 )
         else:
+            export_dir = Path.cwd() / "export"
             filepath = [
-                (Path.cwd() / "export" / s["model"] / s["pathway"] / str(s["year"]))
+                export_dir / s["model"] / s["pathway"] / str(s["year"])
                 for s in self.scenarios
             ]
 
@@ -1200,8 +1250,7 @@ class NewDatabase:
 
         filepath = filepath or Path(Path.cwd() / "export" / "simapro")
 
-        if not os.path.exists(filepath):
-            os.makedirs(filepath)
+        os.makedirs(filepath, exist_ok=True)
 
         print("Write Simapro import file(s).")
 
@@ -1246,8 +1295,7 @@ class NewDatabase:
 
         filepath = filepath or Path(Path.cwd() / "export" / "olca")
 
-        if not os.path.exists(filepath):
-            os.makedirs(filepath)
+        os.makedirs(filepath, exist_ok=True)
 
         print("Write Simapro import file(s) for OpenLCA.")
 
@@ -1357,8 +1405,7 @@ class NewDatabase:
         else:
             filepath = Path(Path.cwd() / "export" / "scenario_report")
 
-        if not os.path.exists(filepath):
-            os.makedirs(filepath)
+        os.makedirs(filepath, exist_ok=True)
 
         name = Path(name)
         if name.suffix != ".xlsx":
@@ -18,7 +18,7 @@ from openpyxl.worksheet.dimensions import ColumnDimension, DimensionHolder
 from pandas.errors import EmptyDataError
 
 from . import __version__
-from .filesystem_constants import DATA_DIR, VARIABLES_DIR
+from .filesystem_constants import DATA_DIR, VARIABLES_DIR, YAMLLoader
 from .logger import empty_log_files
 
 IAM_ELEC_VARS = VARIABLES_DIR / "electricity_variables.yaml"
@@ -56,7 +56,7 @@ def get_variables(
     :param filepath: path to the yaml file
     """
     with open(filepath, "r", encoding="utf-8") as stream:
-        out = yaml.safe_load(stream)
+        out = yaml.load(stream, Loader=YAMLLoader)
 
     return list(out.keys())
 
@@ -440,7 +440,7 @@ def generate_summary_report(scenarios: list, filename: Path) -> None:
     }
 
     with open(REPORT_METADATA_FILEPATH, encoding="utf-8") as stream:
-        metadata = yaml.safe_load(stream)
+        metadata = yaml.load(stream, Loader=YAMLLoader)
 
     workbook = openpyxl.Workbook()
     workbook.remove(workbook.active)
@@ -520,9 +520,7 @@ def generate_summary_report(scenarios: list, filename: Path) -> None:
                         )
 
                         if len(dataframe) > 0:
-                            dataframe = dataframe.to_dataframe("val")
-                            dataframe = dataframe.unstack()["val"]
-                            dataframe = dataframe.T
+                            dataframe = dataframe.to_pandas().T
                             dataframe = dataframe.rename_axis(index=None)
 
                             data = dataframe_to_rows(dataframe)
@@ -592,9 +590,7 @@ def generate_summary_report(scenarios: list, filename: Path) -> None:
                         )
 
                         if len(dataframe) > 0:
-                            dataframe = dataframe.to_dataframe("val")
-                            dataframe = dataframe.unstack()["val"]
-                            dataframe = dataframe.T
+                            dataframe = dataframe.to_pandas().T
                             dataframe = dataframe.rename_axis(index=None)
 
                             data = dataframe_to_rows(dataframe)
@@ -679,7 +675,7 @@ def generate_change_report(source, version, source_type, system_model):
 
     # fetch YAML file containing the reporting metadata
     with open(LOG_REPORTING_FILEPATH, encoding="utf-8") as f:
-        metadata = yaml.load(f, Loader=yaml.FullLoader)
+        metadata = yaml.load(f, Loader=YAMLLoader)
 
     # create a first tab
     # where is displayed
@@ -758,7 +754,7 @@ def fetch_columns(variable):
     """
 
     with open(LOG_REPORTING_FILEPATH, "r", encoding="utf-8") as stream:
-        reporting = yaml.safe_load(stream)
+        reporting = yaml.load(stream, Loader=YAMLLoader)
 
     return list(reporting[variable.stem]["columns"].keys())
 
@@ -770,7 +766,7 @@ def fetch_tab_name(variable):
     """
 
     with open(LOG_REPORTING_FILEPATH, "r", encoding="utf-8") as stream:
-        reporting = yaml.safe_load(stream)
+        reporting = yaml.load(stream, Loader=YAMLLoader)
 
     return reporting[variable]["tab"]
 
@@ -28,7 +28,7 @@ from wurst import transformations as wt
 
 from .activity_maps import InventorySet
 from .data_collection import IAMDataCollection
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 from .geomap import Geomap
 from .utils import get_fuel_properties
 
@@ -41,7 +41,7 @@ if not Path(DIR_LOG_REPORT).exists():
     Path(DIR_LOG_REPORT).mkdir(parents=True, exist_ok=True)
 
 with open(LOG_CONFIG, encoding="utf-8") as f:
-    config = yaml.safe_load(f.read())
+    config = yaml.load(f.read(), Loader=YAMLLoader)
     logging.config.dictConfig(config)
 
 logger = logging.getLogger("module")
@@ -137,27 +137,29 @@ def get_suppliers_of_a_region(
     :param exclude: list of terms to exclude
     """
 
+    # exact names and locations are looked up in sets,
+    # rather than through one `wurst` filter per value
+    locations = set(locations)
+
     if exact_match:
-        filters = [
-            ws.either(*[ws.equals("name", supplier) for supplier in names]),
-        ]
-    else:
-        filters = [
-            ws.either(*[ws.contains("name", supplier) for supplier in names]),
-        ]
+        names = set(names)
 
-    filters += [
-        ws.either(*[ws.equals("location", loc) for loc in locations]),
-        ws.contains("reference product", reference_prod),
-        ws.equals("unit", unit),
-    ]
+        def name_matches(name):
+            return name in names
+
+    else:
 
-    if exclude:
-        filters.append(ws.doesnt_contain_any("name", exclude))
+        def name_matches(name):
+            return any(supplier in name for supplier in names)
 
-    return ws.get_many(
-        database,
-        *filters,
+    return (
+        ds
+        for ds in database
+        if name_matches(ds.get("name"))
+        and ds.get("location") in locations
+        and reference_prod in ds.get("reference product")
+        and ds.get("unit") == unit
+        and not (exclude and any(e in ds.get("name") for e in exclude))
     )
 
 
@@ -1004,10 +1006,9 @@ class BaseTransformation:
                     }
                 )
 
-            elif isinstance(production_variable, list) and all(
-                i in self.iam_data.production_volumes.variables.values.tolist()
-                for i in production_variable
-            ):
+            elif isinstance(production_variable, list) and set(
+                production_variable
+            ).issubset(self.iam_data.production_volumes.variables.values.tolist()):
                 for location in locations:
 
                     if (
@@ -1149,20 +1150,15 @@ class BaseTransformation:
             for exc in excs_to_relink:
                 excs_to_relink_dict[exc["product"]] += exc["amount"]
 
-            # Create a set of unique exchanges to relink
-            # turn this into a list of dictionaries
+            # Create a list of unique exchanges to relink,
+            # deduplicated on hashable keys and in first-seen order,
+            # and only turn the unique ones into dictionaries
             unique_excs_to_relink = [
-                {
-                    "name": exc["name"],
-                    "product": exc["product"],
-                    "location": exc["location"],
-                    "unit": exc["unit"],
-                }
-                for exc in excs_to_relink
-            ]
-            # remove duplicates items in the list
-            unique_excs_to_relink = [
-                dict(t) for t in {tuple(d.items()) for d in unique_excs_to_relink}
+                dict(zip(("name", "product", "location", "unit"), key))
+                for key in dict.fromkeys(
+                    (exc["name"], exc["product"], exc["location"], exc["unit"])
+                    for exc in excs_to_relink
+                )
             ]
 
             # Process exchanges to relink
@@ -1893,10 +1889,11 @@ class BaseTransformation:
 
     def handle_iam_region(self, exchange, dataset, possible_datasets, new_exchanges):
         # In IAM regions, we need to look for possible local datasets
+        possible_locations = {ds["location"] for ds in possible_datasets}
         locs = [
             iloc
             for iloc in self.iam_to_ecoinvent_loc[dataset["location"]]
-            if iloc in [ds["location"] for ds in possible_datasets]
+            if iloc in possible_locations
         ]
 
         if locs:
@@ -13,7 +13,7 @@ import yaml
 from wurst import searching as ws
 
 from .activity_maps import InventorySet
-from .filesystem_constants import DATA_DIR, IAM_OUTPUT_DIR
+from .filesystem_constants import DATA_DIR, IAM_OUTPUT_DIR, YAMLLoader
 from .logger import create_logger
 from .transformation import BaseTransformation, IAMDataCollection
 from .utils import eidb_label, rescale_exchanges
@@ -95,7 +95,7 @@ def get_battery_size() -> dict:
     with open(
         DATA_DIR / "transport" / "battery_size.yaml", "r", encoding="utf-8"
     ) as stream:
-        out = yaml.safe_load(stream)
+        out = yaml.load(stream, Loader=YAMLLoader)
         return out
 
 
@@ -106,7 +106,7 @@ def get_average_truck_load_factors() -> Dict[str, Dict[str, Dict[str, float]]]:
     :return: dictionary with load factors per truck size class
     """
     with open(FILEPATH_TRUCK_LOAD_FACTORS, "r", encoding="utf-8") as stream:
-        out = yaml.safe_load(stream)
+        out = yaml.load(stream, Loader=YAMLLoader)
         return out
 
 
@@ -118,7 +118,7 @@ def get_vehicles_mapping() -> Dict[str, dict]:
     :return: dictionary to map terminology between carculator and ecoinvent
     """
     with open(FILEPATH_VEHICLES_MAP, "r", encoding="utf-8") as stream:
-        out = yaml.safe_load(stream)
+        out = yaml.load(stream, Loader=YAMLLoader)
         return out
 
 
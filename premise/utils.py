@@ -27,6 +27,7 @@ from .filesystem_constants import (
     DIR_CACHED_DB,
     DIR_CACHED_FILES,
     VARIABLES_DIR,
+    YAMLLoader,
 )
 from .geomap import Geomap
 
@@ -119,7 +120,7 @@ def load_constants():
     :return: dict
     """
     with open(VARIABLES_DIR / "constants.yaml", "r", encoding="utf-8") as stream:
-        constants = yaml.safe_load(stream)
+        constants = yaml.load(stream, Loader=YAMLLoader)
 
     return constants
 
@@ -137,7 +138,7 @@ def get_fuel_properties() -> dict:
     """
 
     with open(FUELS_PROPERTIES, "r", encoding="utf-8") as stream:
-        fuel_props = yaml.safe_load(stream)
+        fuel_props = yaml.load(stream, Loader=YAMLLoader)
 
     return fuel_props
 
@@ -149,7 +150,7 @@ def get_crops_properties() -> dict:
     :return: dict
     """
     with open(CROPS_PROPERTIES, "r", encoding="utf-8") as stream:
-        crop_props = yaml.safe_load(stream)
+        crop_props = yaml.load(stream, Loader=YAMLLoader)
 
     return crop_props
 
@@ -162,7 +163,7 @@ def get_water_consumption_factors() -> dict:
     with open(
         DATA_DIR / "renewables" / "hydropower.yaml", "r", encoding="utf-8"
     ) as stream:
-        water_consumption_factors = yaml.safe_load(stream)
+        water_consumption_factors = yaml.load(stream, Loader=YAMLLoader)
 
     return water_consumption_factors
 
@@ -244,13 +245,17 @@ def clear_existing_cache(all_versions: Optional[bool] = False, filter=None) -> N
     inventories.
     """
 
-    [
-        f.unlink()
-        for f in DIR_CACHED_DB.glob("*")
-        if f.is_file()
-        and (all_versions or "".join(tuple(map(str, __version__))) not in f.name)
-        and (filter is None or filter in f.name)
-    ]
+    version = "".join(tuple(map(str, __version__)))
+
+    # `os.scandir` entries know their type, no extra `stat` call is needed
+    with os.scandir(DIR_CACHED_DB) as entries:
+        for entry in entries:
+            if (
+                entry.is_file()
+                and (all_versions or version not in entry.name)
+                and (filter is None or filter in entry.name)
+            ):
+                os.unlink(entry.path)
 
 
 # clear the cache folder
@@ -397,7 +402,7 @@ def dump_database(scenario):
     name = f"{uuid.uuid4().hex}.pickle"
     # dump as pickle
     with open(DIR_CACHED_FILES / name, "wb") as f:
-        pickle.dump(scenario["database"], f)
+        pickle.dump(scenario["database"], f, protocol=pickle.HIGHEST_PROTOCOL)
     scenario["database filepath"] = DIR_CACHED_FILES / name
     del scenario["database"]
 
@@ -432,5 +437,7 @@ def delete_all_pickles():
     """
     Delete all pickle files in the cache folder.
     """
-    for file in DIR_CACHED_FILES.glob("*.pickle"):
-        file.unlink()
+    with os.scandir(DIR_CACHED_FILES) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pickle") and entry.is_file():
+                os.unlink(entry.path)
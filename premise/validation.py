@@ -9,7 +9,7 @@ import numpy as np
 import pandas as pd
 import yaml
 
-from .filesystem_constants import DATA_DIR
+from .filesystem_constants import DATA_DIR, YAMLLoader
 from .geomap import Geomap
 from .logger import create_logger
 from .utils import rescale_exchanges
@@ -21,7 +21,7 @@ def load_electricity_keys():
     # load electricity keys from data/utils/validation/electricity.yaml
 
     with open(DATA_DIR / "utils/validation/electricity.yaml", encoding="utf-8") as f:
-        electricity_keys = yaml.safe_load(f)
+        electricity_keys = yaml.load(f, Loader=YAMLLoader)
 
     return electricity_keys
 
@@ -30,7 +30,7 @@ def load_waste_keys():
     # load waste keys from data/utils/validation/waste flows.yaml
 
     with open(DATA_DIR / "utils/validation/waste flows.yaml", encoding="utf-8") as f:
-        waste_keys = yaml.safe_load(f)
+        waste_keys = yaml.load(f, Loader=YAMLLoader)
 
     return waste_keys
 
@@ -41,7 +41,7 @@ def load_waste_flows_exceptions():
     with open(
         DATA_DIR / "utils/validation/waste flows exceptions.yaml", encoding="utf-8"
     ) as f:
-        waste_flows_exceptions = yaml.safe_load(f)
+        waste_flows_exceptions = yaml.load(f, Loader=YAMLLoader)
 
     return waste_flows_exceptions
 
@@ -52,7 +52,7 @@ def load_circular_exceptions():
     with open(
         DATA_DIR / "utils/validation/circular exceptions.yaml", encoding="utf-8"
     ) as f:
-        circular_exceptions = yaml.safe_load(f)
+        circular_exceptions = yaml.load(f, Loader=YAMLLoader)
 
     return circular_exceptions
 
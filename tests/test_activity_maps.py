@@ -1,5 +1,9 @@
 # content of test_activity_maps.py
-from premise.activity_maps import InventorySet
+import os
+import pickle
+
+from premise import activity_maps
+from premise.activity_maps import InventorySet, _load_yaml
 
 dummy_minimal_db = [
     {
@@ -56,3 +60,79 @@ def test_length_dict():
     assert len(maps.powerplant_filters) > 0
     assert len(maps.powerplant_fuels_filters) > 0
     assert len(maps.fuels_filters) > 0
+
+
+def test_generate_sets_from_filters():
+    maps = InventorySet(dummy_minimal_db)
+    mapping = maps.generate_sets_from_filters(
+        {
+            "coal": {"fltr": "hard coal", "mask": "co-generation"},
+            "gas": {"fltr": {"name": ["natural gas"]}, "mask": {"name": "heat"}},
+            "aluminium": {"fltr": {"name": "aluminium"}},
+        }
+    )
+    assert mapping["coal"] == {
+        "electricity production, at power plant/hard coal, pre, pipeline 200km, storage 1000m",
+        "electricity production, at power plant/hard coal, post, pipeline 200km, storage 1000m",
+        "electricity production, hard coal",
+    }
+    assert mapping["gas"] == {
+        "electricity production, at power plant/natural gas, pre, pipeline 200km, storage 1000m",
+        "electricity production, natural gas, conventional power plant",
+        "electricity production, natural gas, combined cycle power plant",
+    }
+    assert mapping["aluminium"] == {"market for aluminium, primary"}
+
+
+def test_generate_sets_from_many_filters():
+    maps = InventorySet(dummy_minimal_db)
+    powerplants, chp = maps.generate_sets_from_many_filters(
+        {
+            "coal": {"fltr": "hard coal", "mask": "co-generation"},
+            "nuclear": {"fltr": {"name": "nuclear"}},
+        },
+        {
+            "coal": {"fltr": "hard coal", "mask": "electricity production"},
+            "gas": {"fltr": {"name": ["co-generation, natural gas"]}},
+        },
+    )
+    assert powerplants == {
+        "coal": {
+            "electricity production, at power plant/hard coal, pre, pipeline 200km, storage 1000m",
+            "electricity production, at power plant/hard coal, post, pipeline 200km, storage 1000m",
+            "electricity production, hard coal",
+        },
+        "nuclear": {"electricity production, nuclear, pressure water reactor"},
+    }
+    assert chp == {
+        "coal": {"heat and power co-generation, hard coal"},
+        "gas": {
+            "heat and power co-generation, natural gas, conventional power plant, 100MW electrical"
+        },
+    }
+
+
+def test_load_yaml_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(activity_maps, "DIR_CACHED_DB", tmp_path)
+    yaml_fp = tmp_path / "dummy.yaml"
+    yaml_fp.write_text("a: 1\n")
+    os.utime(yaml_fp, (1000, 1000))
+
+    _load_yaml.cache_clear()
+    assert _load_yaml(str(yaml_fp)) == {"a": 1}
+    (cached_fp,) = tmp_path.glob("*_dummy_yaml.pickle")
+    assert not list(tmp_path.glob("*.tmp"))
+
+    # the pickle is used as long as it is newer than the YAML file
+    with open(cached_fp, "wb") as stream:
+        pickle.dump({"a": 2}, stream)
+    os.utime(cached_fp, (2000, 2000))
+    _load_yaml.cache_clear()
+    assert _load_yaml(str(yaml_fp)) == {"a": 2}
+
+    # a modified YAML file invalidates the pickle
+    yaml_fp.write_text("a: 3\n")
+    os.utime(yaml_fp, (3000, 3000))
+    _load_yaml.cache_clear()
+    assert _load_yaml(str(yaml_fp)) == {"a": 3}
+    _load_yaml.cache_clear()
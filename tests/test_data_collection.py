@@ -0,0 +1,29 @@
+from types import SimpleNamespace
+
+import numpy as np
+import xarray as xr
+
+from premise.data_collection import IAMDataCollection
+
+
+def test_efficiencies_dims_with_mixed_production_labels():
+    data = xr.DataArray(
+        np.random.rand(2, 4, 3) + 1,
+        coords={
+            "region": ["EUR", "USA"],
+            "variables": ["prod A", "prod B1", "prod B2", "energy"],
+            "year": [2020, 2030, 2040],
+        },
+        dims=["region", "variables", "year"],
+    )
+
+    eff_data = IAMDataCollection.get_iam_efficiencies(
+        SimpleNamespace(year=2030, min_year=2005),
+        data=data,
+        production_labels={"A": "prod A", "B": ["prod B1", "prod B2"]},
+        energy_labels={"A": ["energy"], "B": ["energy"]},
+        use_absolute_efficiency=True,
+    )
+
+    assert eff_data.dims == ("variables", "region", "year")
+    assert eff_data.variables.values.tolist() == ["A", "B"]
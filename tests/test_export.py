@@ -100,3 +100,67 @@ def test_remove_uncertainty():
         for exc in ds["exchanges"]:
             if "uncertainty_type" in exc:
                 assert exc["uncertainty_type"] == 0
+
+
+def test_describe_scenario():
+    assert describe_scenario("remind - SSP2-Base - 2050") == {
+        "name": "remind - SSP2-Base - 2050",
+        "description": "Prospective db, based on REMIND, "
+        "pathway SSP2-BASE, for the year 2050.",
+    }
+    assert describe_scenario("image - SSP2-RCP19 - 2030 - high - low") == {
+        "name": "image - SSP2-RCP19 - 2030 - high - low",
+        "description": "Prospective db, based on IMAGE, "
+        "pathway SSP2-RCP19, for the year 2030, "
+        "and external scenario high low.",
+    }
+
+
+def test_superstructure_db_parquet(tmp_path, monkeypatch):
+    df = pd.DataFrame(
+        {
+            "from activity name": ["fake activity", "1,4-Butanediol"],
+            "from reference product": ["fake product", None],
+            "from location": ["FR", None],
+            "from categories": [None, ("air", "urban air close to ground")],
+            "from database": ["dummy_db", "dummy_bio"],
+            "from key": [None, ("dummy_bio", "123")],
+            "from unit": ["kilogram", "kilogram"],
+            "to activity name": ["fake activity", "fake activity"],
+            "to reference product": ["fake product", "fake product"],
+            "to location": ["FR", "FR"],
+            "to categories": [None, None],
+            "to unit": ["kilogram", "kilogram"],
+            "to database": ["dummy_db", "dummy_db"],
+            "to key": [None, None],
+            "flow type": ["production", "biosphere"],
+            "original": [1.0, 1.0],
+            "remind - SSP2-Base - 2050": [0.0, 0.5],
+        }
+    )
+    monkeypatch.setattr(
+        "premise.export.generate_scenario_difference_file",
+        lambda **kwargs: (df.copy(), [], None),
+    )
+    # the Excel row limit does not apply to Parquet files
+    monkeypatch.setattr("premise.export.EXCEL_MAX_ROWS", 1)
+
+    generate_superstructure_db(
+        origin_db=[],
+        scenarios=[],
+        db_name="dummy_db",
+        biosphere_name="dummy_bio",
+        filepath=tmp_path,
+        version="3.10",
+        scenario_list=["remind - SSP2-Base - 2050"],
+        file_format="parquet",
+    )
+
+    assert [f.name for f in tmp_path.iterdir()] == ["scenario_diff_dummy_db.parquet"]
+    result = pd.read_parquet(tmp_path / "scenario_diff_dummy_db.parquet")
+    assert "original" not in result.columns
+    assert "from unit" not in result.columns
+    assert result["remind - SSP2-Base - 2050"].tolist() == [1.0, 0.5]
+    assert result["from key"][0] is None
+    assert tuple(result["from key"][1]) == ("dummy_bio", "123")
+    assert tuple(result["from categories"][1]) == ("air", "urban air close to ground")
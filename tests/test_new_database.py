@@ -0,0 +1,43 @@
+from premise import new_database
+from premise.new_database import NewDatabase
+from premise.utils import load_database
+
+
+def _tag_datasets(scenario, version, system_model):
+    for dataset in scenario["database"]:
+        dataset["comment"] = f"{scenario['year']}, {version}, {system_model}"
+    return scenario
+
+
+def _updated_databases(parallel):
+    ndb = NewDatabase.__new__(NewDatabase)
+    ndb.version = "3.10"
+    ndb.system_model = "cutoff"
+    ndb.use_absolute_efficiency = False
+    ndb.gains_scenario = "CLE"
+    ndb.database = [
+        {"name": "fake activity", "location": "FR", "exchanges": []},
+        {"name": "other fake activity", "location": "DE", "exchanges": []},
+    ]
+    ndb.scenarios = [
+        {"model": "remind", "pathway": "SSP2-Base", "year": year}
+        for year in (2030, 2050)
+    ]
+
+    ndb.update("biomass", parallel=parallel)
+
+    return [
+        (load_database(scenario)["database"], scenario["applied functions"])
+        for scenario in ndb.scenarios
+    ]
+
+
+def test_update_parallel(monkeypatch):
+    monkeypatch.setattr(new_database, "_update_biomass", _tag_datasets)
+
+    sequential = _updated_databases(parallel=False)
+    assert sequential[0][0][0]["comment"] == "2030, 3.10, cutoff"
+    assert sequential[1][0][0]["comment"] == "2050, 3.10, cutoff"
+    assert sequential[0][1] == ["biomass"]
+
+    assert _updated_databases(parallel=True) == sequential